@@ -1,11 +1,27 @@
 """
 Main FastAPI application for the Data Analysis Platform.
 """
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+from datetime import datetime
+from tempfile import SpooledTemporaryFile
 from typing import Dict, Optional, Any
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from uuid import uuid4
+from fastapi import APIRouter, FastAPI, File, UploadFile, HTTPException
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
+import orjson
 import uvicorn
  
+try:
+    # blake3 is SIMD-accelerated and much faster than blake2b on large uploads
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
 from models.data_analyzer import DataAnalyzer
 from models.ai_service import AIService
 from utils.file_processor import process_file
@@ -15,12 +31,32 @@ app = FastAPI(
     title="Data Analysis Platform API",
     description="API for processing and analyzing data files with AI-powered insights",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
+
+# Allow the frontend dev server to call the API from another origin
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["*"],
+    allow_headers=["*"],
 )
 
+# Single router registered under /api (used by the frontend) and the
+# legacy unprefixed paths, so endpoints are defined exactly once
+router = APIRouter()
 
-# Global data store - in a production app, this would use a database
-current_data = None
-current_analyzer = None
+
+# Per-upload session store keyed by session_id - in a production app this
+# would live in Redis so multiple workers could share it
+SESSIONS: OrderedDict = OrderedDict()
+_MAX_SESSIONS = 64
+_latest_session_id: Optional[str] = None
+
+# Content-addressed cache of processed uploads so re-uploading the same
+# file returns the parsed data, stats and visualizations without recompute
+_upload_cache: OrderedDict = OrderedDict()
+_UPLOAD_CACHE_ENTRIES = 8
 
 # Initialize AI service
 ai_service = AIService()
@@ -30,10 +66,12 @@ class AIRequest(BaseModel):
     question: str
     model: str
     context: Optional[Dict[str, Any]] = None
+    session_id: Optional[str] = None
 
-# class CorrelationRequest(BaseModel):
-#     column1: str
-#     column2: str
+class CorrelationRequest(BaseModel):
+    column1: str
+    column2: str
+    session_id: Optional[str] = None
 
 # Response models
 class AIResponse(BaseModel):
@@ -42,6 +80,27 @@ class AIResponse(BaseModel):
     processing_time: float
 
 
+def _stream_upload_response(session_id, data, stats, visualizations, chunk_rows=1000):
+    """
+    Yield the upload response as JSON bytes, emitting the data records in
+    row chunks so the full payload is never buffered server-side.
+    """
+    yield b'{"status":"success","session_id":"' + session_id.encode() + b'","data":['
+    first = True
+    for start in range(0, len(data), chunk_rows):
+        # Strip the surrounding brackets from each chunk's record array
+        chunk = data.iloc[start:start + chunk_rows].to_json(orient='records', date_format='iso')
+        body = chunk[1:-1].encode()
+        if body:
+            if not first:
+                yield b','
+            yield body
+            first = False
+    yield b'],"stats":' + orjson.dumps(stats, option=orjson.OPT_SERIALIZE_NUMPY)
+    yield b',"visualizations":' + orjson.dumps(visualizations, option=orjson.OPT_SERIALIZE_NUMPY)
+    yield b'}'
+
+
 # Root endpoint to verify that the API is running
 @app.get("/")
 async def root():
@@ -50,13 +109,13 @@ async def root():
 
 
 # Endpoint to upload a file and perform initial analysis
-@app.post("/upload")
+@router.post("/upload")
 async def upload_file(file: UploadFile = File(...)):
     """
     Upload and process a data file (CSV or Excel).
-    Returns processed data, statistics, and visualizations.
+    Returns a session id plus processed data, statistics, and visualizations.
     """
-    global current_data, current_analyzer
+    global _latest_session_id
 
     if not file:
         raise HTTPException(status_code=400, detail="No file provided")
@@ -70,34 +129,62 @@ async def upload_file(file: UploadFile = File(...)):
         )
 
     try:
-        # Read file content asynchronously
-        file_content = await file.read()
+        # Spool the upload to a temp file in 1 MB chunks instead of
+        # buffering the entire payload in memory at once, hashing as we go
+        file_obj = SpooledTemporaryFile(max_size=16 * 1024 * 1024)
+        hasher = blake3() if blake3 is not None else hashlib.blake2b(digest_size=16)
+        while chunk := await file.read(1024 * 1024):
+            hasher.update(chunk)
+            file_obj.write(chunk)
+        file_obj.seek(0)
+        digest = hasher.hexdigest()
 
-        # Process and convert the uploaded file to a DataFrame
-        data, file_info = process_file(file_content, file.filename, file_ext)
+        if digest in _upload_cache:
+            # Identical content was uploaded before: reuse the parsed data
+            # and precomputed analysis, refreshing the file-specific fields
+            data, analyzer, stats, visualizations = _upload_cache[digest]
+            _upload_cache.move_to_end(digest)
+            stats = {
+                **stats,
+                'file_name': file.filename,
+                'last_modified': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+        else:
+            # Parse in a worker thread so the event loop stays responsive
+            data, file_info = await asyncio.to_thread(
+                process_file, file_obj, file.filename, file_ext
+            )
 
-        # Initialize analyzer for data exploration
-        analyzer = DataAnalyzer(data)
+            # Initialize analyzer for data exploration
+            analyzer = DataAnalyzer(data)
 
-        # Get basic stats like mean, median, missing values, etc.
-        stats = analyzer.get_basic_stats()
+            # Get basic stats like mean, median, missing values, etc.
+            stats = analyzer.get_basic_stats()
 
-        # Include file-related info (name, size, format)
-        stats.update(file_info)
+            # Include file-related info (name, size, format)
+            stats.update(file_info)
 
-        # Generate basic visualizations (histograms, correlations, etc.)
-        visualizations = analyzer.generate_visualizations()
+            # Generate basic visualizations (histograms, correlations, etc.)
+            visualizations = analyzer.generate_visualizations()
 
-        # Save current state to memory for use in other endpoints
-        current_data = data
-        current_analyzer = analyzer
+            # Cache the processed upload, evicting the oldest entry
+            _upload_cache[digest] = (data, analyzer, stats, visualizations)
+            if len(_upload_cache) > _UPLOAD_CACHE_ENTRIES:
+                _upload_cache.popitem(last=False)
 
-        return {
-            "status": "success",
-            "data": data.to_dict(orient='records'),  # convert to list of dicts
-            "stats": stats,
-            "visualizations": visualizations
-        }
+        # Register a session for this upload so other endpoints can find it
+        session_id = uuid4().hex
+        SESSIONS[session_id] = (data, analyzer)
+        if len(SESSIONS) > _MAX_SESSIONS:
+            SESSIONS.popitem(last=False)
+        _latest_session_id = session_id
+
+        # Stream the response in chunks so the client starts receiving bytes
+        # immediately and the server never buffers the whole payload
+        return StreamingResponse(
+            _stream_upload_response(session_id, data, stats, visualizations),
+            media_type="application/json"
+        )
 
     except Exception as e:
         raise HTTPException(
@@ -107,27 +194,33 @@ async def upload_file(file: UploadFile = File(...)):
 
 
 # Endpoint to ask AI a question about the uploaded data
-@app.post("/ask-ai", response_model=AIResponse)
+@router.post("/ask-ai", response_model=AIResponse)
 async def ask_ai(request: AIRequest):
     """
     Ask a question about the data and get an AI-powered response.
     """
-    global current_data, current_analyzer
+    # Resolve the session; fall back to the latest upload for older clients
+    # that do not send a session_id yet
+    session_id = request.session_id or _latest_session_id
 
     # Ensure data is available before allowing queries
-    if current_data is None:
+    if session_id is None or session_id not in SESSIONS:
         raise HTTPException(
             status_code=400,
             detail="No data available. Please upload a file first."
         )
 
+    data, analyzer = SESSIONS[session_id]
+
     try:
-        # Use the AI service to get an answer to the question
-        response = ai_service.get_response(
-            question=request.question,
-            model=request.model,
-            data=current_data,
-            context=request.context
+        # Run the blocking OpenRouter call in a worker thread so the event
+        # loop can keep serving other requests during the LLM round trip
+        response = await asyncio.to_thread(
+            ai_service.get_response,
+            request.question,
+            request.model,
+            data,
+            request.context
         )
         return response
 
@@ -138,11 +231,78 @@ async def ask_ai(request: AIRequest):
         )
 
 
+# Endpoint to get detailed statistics for a single column
+@router.get("/column-stats/{column_name}")
+async def get_column_stats(column_name: str, session_id: Optional[str] = None):
+    """
+    Get detailed statistics for a single column of the uploaded data.
+    """
+    session_id = session_id or _latest_session_id
+
+    if session_id is None or session_id not in SESSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail="No data available. Please upload a file first."
+        )
+
+    data, analyzer = SESSIONS[session_id]
+
+    try:
+        return await asyncio.to_thread(analyzer.get_column_stats, column_name)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e).strip('"\''))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error getting column statistics: {str(e)}"
+        )
+
+
+# Endpoint to compute the correlation between two columns
+@router.post("/correlation")
+async def get_correlation(request: CorrelationRequest):
+    """
+    Calculate the correlation between two columns of the uploaded data.
+    """
+    session_id = request.session_id or _latest_session_id
+
+    if session_id is None or session_id not in SESSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail="No data available. Please upload a file first."
+        )
+
+    data, analyzer = SESSIONS[session_id]
+
+    try:
+        return await asyncio.to_thread(
+            analyzer.calculate_correlation, request.column1, request.column2
+        )
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e).strip('"\''))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error calculating correlation: {str(e)}"
+        )
+
+
+# Register the routes under /api and keep the legacy unprefixed paths
+app.include_router(router, prefix="/api")
+app.include_router(router)
+
+
 if __name__ == "__main__":
-    # Run the FastAPI application with uvicorn
+    # Run the FastAPI application with uvicorn. In production (ENV=prod)
+    # the stat-based reloader is disabled and multiple workers are used
+    # on the faster uvloop/httptools stack.
+    is_prod = os.getenv("ENV") == "prod"
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "4")) if is_prod else 1,
+        reload=not is_prod
     )
@@ -2,12 +2,49 @@
 AI Service for interacting with the OpenRouter API.
 """
 
-import json
+import io
+import os
 import time
 import requests
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 import pandas as pd
 
+try:
+    # joblib is optional; wide frames fall back to the serial path without it
+    from joblib import Parallel, delayed
+except ImportError:
+    Parallel = None
+
+# Column count above which per-column work is worth spreading over threads
+_PARALLEL_COLUMN_THRESHOLD = 32
+
+
+def _unique_non_null(series: pd.Series):
+    """Return the unique non-null values of a Series."""
+    return series.dropna().unique()
+
+
+# Fixed system prompt, built once at import time so every request reuses the
+# identical prefix (which also maximizes provider-side prompt-cache hits)
+SYSTEM_PROMPT = (
+    "You are an AI data analyst assistant. You'll be given data information and a question about this data. "
+    "Provide a helpful, informative, and accurate response based on the data provided. "
+    "If you can't answer based on the available data, explain what would be needed to answer it correctly. "
+    "When appropriate, offer insights that might not be directly asked for but would be valuable to the user. "
+    "For numerical answers, include the number in the response."
+    "Answer in short & consise way such as it will easy for user to understand."
+)
+
+# Stable data-description prefix and per-question tail, kept separate so the
+# cacheable part of the user message is byte-identical across follow-ups
+USER_PROMPT_PREFIX = (
+    "Here's information about my data:\n\n{data_description}\n\n"
+    "Answer in short & consise way such as it will easy for user to understand.\n\n"
+    " Answer in sinple text format, not need to do any kind of formating for web or app view."
+)
+USER_PROMPT_QUESTION = "\n\nMy question is: {question}"
+
 class AIService:
     """
     Service for generating AI-powered insights from data.
@@ -17,11 +54,8 @@ class AIService:
         """
         Initialize the AI service.
         """
-        
-        
-        
-        # Model mappings - OpenRouter model IDs
-        self.api_key = 'now-you-see-me; now-you-don\'t'
+        # API key is read from the environment once; never keep it in source
+        self.api_key = os.environ.get("OPENROUTER_API_KEY", "")
         self.api_base = "https://openrouter.ai/api/v1"
 
         self.models = {
@@ -29,6 +63,33 @@ class AIService:
             "meta-llama/llama-3.3-8b-instruct:free": "meta-llama/llama-3.3-8b-instruct:free",
             "qwen/qwen3-30b-a3b:free": "qwen/qwen3-30b-a3b:free",
         }
+
+        # Persistent HTTP session so TCP/TLS connections to OpenRouter are reused
+        # across calls instead of paying a fresh handshake per request
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+            "HTTP-Referer": "https://datainsight.ai",  # Replace with your actual domain
+            "X-Title": "Data Analyzer AI Analysis Platform"
+        })
+        self._session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        )
+
+        # Bounded LRU cache of answers keyed by (model, question, data fingerprint)
+        # so repeated questions about the same data skip the API round trip
+        self._response_cache: OrderedDict = OrderedDict()
+        self._max_cached_responses = 512
+
+        # Cache of prepared data descriptions keyed by data fingerprint so
+        # follow-up questions about the same upload skip the stats passes
+        self._description_cache: OrderedDict = OrderedDict()
+        self._max_cached_descriptions = 32
+
+        # Cap on how many rows are scanned when describing very large frames
+        self._description_sample_rows = 100_000
     
     def get_response(
         self, 
@@ -56,26 +117,45 @@ class AIService:
             model = "meta-llama/llama-3.3-8b-instruct:free"  # Default if model not found
         
         openrouter_model = model
+
+        # Return a cached answer if the same question was already asked about this data
+        cache_key = (model, question.strip().lower(), self._fingerprint_data(data))
+        if cache_key in self._response_cache:
+            self._response_cache.move_to_end(cache_key)
+            return {
+                "answer": self._response_cache[cache_key],
+                "model_used": model,
+                "processing_time": 0.0
+            }
+
+        # Prepare data description, reusing the cached one for follow-up
+        # questions about the same upload
+        fingerprint = cache_key[2]
+        data_description = self._description_cache.get(fingerprint)
+        if data_description is None:
+            # Describe a bounded sample of very large frames; aggregate stats
+            # on a 100k-row sample are accurate enough for LLM context
+            if len(data) > self._description_sample_rows:
+                sample = data.sample(self._description_sample_rows, random_state=0)
+            else:
+                sample = data
+            data_description = self._prepare_data_description(sample, context, total_rows=len(data))
+            self._description_cache[fingerprint] = data_description
+            if len(self._description_cache) > self._max_cached_descriptions:
+                self._description_cache.popitem(last=False)
         
-        # Prepare data description
-        data_description = self._prepare_data_description(data, context)
-        
-        # Create messages for the AI
+        # Create messages for the AI from the precompiled prompt parts
         messages = [
             {
                 "role": "system",
-                "content": ( 
-                    "You are an AI data analyst assistant. You'll be given data information and a question about this data. "
-                    "Provide a helpful, informative, and accurate response based on the data provided. "
-                    "If you can't answer based on the available data, explain what would be needed to answer it correctly. "
-                    "When appropriate, offer insights that might not be directly asked for but would be valuable to the user. "
-                    "For numerical answers, include the number in the response."
-                    "Answer in short & consise way such as it will easy for user to understand."
-                )
+                "content": SYSTEM_PROMPT
             },
             {
-                "role": "user", 
-                "content": f"Here's information about my data:\n\n{data_description}\n\nAnswer in short & consise way such as it will easy for user to understand.\n\n Answer in sinple text format, not need to do any kind of formating for web or app view.\n\nMy question is: {question}"
+                "role": "user",
+                "content": (
+                    USER_PROMPT_PREFIX.format(data_description=data_description)
+                    + USER_PROMPT_QUESTION.format(question=question)
+                )
             }
         ]
         
@@ -89,8 +169,13 @@ class AIService:
             if not answer:
                 answer = "I couldn't generate a response. Please try again or try a different question."
             
+            # Cache the successful answer, evicting the least recently used entry
+            self._response_cache[cache_key] = answer
+            if len(self._response_cache) > self._max_cached_responses:
+                self._response_cache.popitem(last=False)
+
             processing_time = time.time() - start_time
-            
+
             return {
                 "answer": answer,
                 "model_used": model,
@@ -105,82 +190,127 @@ class AIService:
                 "processing_time": round(time.time() - start_time, 2)
             }
     
+    def _fingerprint_data(self, data: pd.DataFrame) -> int:
+        """
+        Compute a session-stable fingerprint of a DataFrame.
+
+        Every row is hashed: the vectorized hash pass is trivial next to an
+        LLM round trip, and sampling would let two uploads that differ
+        beyond the sample serve each other's cached answers.
+
+        Args:
+            data: The pandas DataFrame
+
+        Returns:
+            Integer fingerprint of the data shape, columns and values
+        """
+        row_hashes = pd.util.hash_pandas_object(data, index=False).values.tobytes()
+        return hash((data.shape, tuple(data.columns), row_hashes))
+
     def _prepare_data_description(
-        self, 
-        data: pd.DataFrame, 
-        context: Optional[Dict[str, Any]] = None
+        self,
+        data: pd.DataFrame,
+        context: Optional[Dict[str, Any]] = None,
+        total_rows: Optional[int] = None
     ) -> str:
         """
         Prepare a textual description of the data for the AI.
-        
+
         Args:
-            data: The pandas DataFrame
+            data: The pandas DataFrame (possibly a sample of the full data)
             context: Additional context about the data
-            
+            total_rows: Row count of the full dataset when data is a sample
+
         Returns:
             String description of the data
         """
+        # Write into a single string buffer rather than accumulating a list
+        # of short-lived line strings and joining them at the end
+        buf = io.StringIO()
+        write = buf.write
+
         # Start with basic info
-        description = [
-            f"The dataset has {len(data)} rows and {len(data.columns)} columns."
+        write(
+            f"The dataset has {total_rows if total_rows is not None else len(data)} rows "
+            f"and {len(data.columns)} columns.\n"
+        )
+
+        # Build the entire per-column summary with a few batched pandas ops
+        # and serialize it in one shot, instead of formatting every column
+        # with separate Python-level calls
+        n_rows = len(data)
+        missing_counts = data.isna().sum()
+        numeric = data.select_dtypes(include='number')
+        summary = pd.DataFrame({
+            'dtype': data.dtypes.astype(str),
+            'missing': missing_counts,
+            'missing_pct': (100 * missing_counts / n_rows).round(2) if n_rows > 0 else 0,
+        })
+
+        # Unique counts only matter for the label columns, so skip the
+        # nunique scan over the numeric columns entirely
+        non_numeric_cols = data.columns.difference(numeric.columns)
+        summary['n_unique'] = data[non_numeric_cols].nunique(dropna=True)
+
+        # Fill the numeric stats for all numeric columns in one aggregation
+        if len(numeric.columns) > 0:
+            summary.loc[numeric.columns, ['min', 'max', 'mean', 'median']] = \
+                numeric.agg(['min', 'max', 'mean', 'median']).T.values
+
+        # Add column information as one compact CSV table
+        write("\nColumns in the dataset (one row per column):\n")
+        write(summary.to_csv(index_label='column'))
+        write("\n")
+
+        # Spell out the values of low-cardinality non-numeric columns, since
+        # those labels are what users usually ask about
+        numeric_set = set(numeric.columns)
+        label_cols = [
+            column for column in data.columns
+            if column not in numeric_set and summary.at[column, 'n_unique'] <= 10
         ]
-        
-        # Add column information
-        description.append("\nColumns in the dataset:")
-        
-        for column in data.columns:
-            col_type = str(data[column].dtype)
-            missing = data[column].isna().sum()
-            missing_pct = round(100 * missing / len(data), 2) if len(data) > 0 else 0
-            
-            # Add column description
-            description.append(f"- {column} (type: {col_type}, missing: {missing} ({missing_pct}%))")
-            
-            # Add some sample values for context (limited to prevent prompt getting too large)
-            non_null_values = data[column].dropna()
-            if len(non_null_values) > 0:
-                if col_type.startswith(('int', 'float')):
-                    # For numerical columns, add statistical info
-                    description.append(f"  Range: {non_null_values.min()} to {non_null_values.max()}")
-                    description.append(f"  Mean: {non_null_values.mean():.2f}, Median: {non_null_values.median()}")
-                else:
-                    # For other columns, add unique values (if not too many)
-                    unique_values = non_null_values.unique()
-                    if len(unique_values) <= 10:
-                        description.append(f"  Unique values: {', '.join(str(v) for v in unique_values[:10])}")
-                    else:
-                        description.append(f"  Has {len(unique_values)} unique values")
-                        description.append(f"  Examples: {', '.join(str(v) for v in unique_values[:5])}")
-        
+
+        # The per-column unique() calls release the GIL inside pandas, so on
+        # wide frames they parallelize well across threads
+        if Parallel is not None and len(data.columns) > _PARALLEL_COLUMN_THRESHOLD:
+            uniques = Parallel(n_jobs=4, prefer='threads')(
+                delayed(_unique_non_null)(data[column]) for column in label_cols
+            )
+        else:
+            uniques = [_unique_non_null(data[column]) for column in label_cols]
+
+        for column, unique_values in zip(label_cols, uniques):
+            write(f"Values of {column}: {', '.join(str(v) for v in unique_values[:10])}\n")
+
         # Add insights from context if provided
         if context:
             if 'columns' in context:
                 # Add data types distribution if available
-                description.append("\nColumn types distribution:")
-                
+                write("\nColumn types distribution:\n")
+
                 if 'columnTypes' in context:
                     for type_name, count in context['columnTypes'].items():
-                        description.append(f"- {type_name}: {count} columns")
-            
+                        write(f"- {type_name}: {count} columns\n")
+
             # Add any correlations if available
             if 'correlations' in context and isinstance(context['correlations'], list):
                 if len(context['correlations']) > 0:
-                    description.append("\nTop correlations between columns:")
-                    
+                    write("\nTop correlations between columns:\n")
+
                     for correlation in context['correlations'][:5]:  # Limit to top 5
                         columns = correlation.get('columns', '')
                         value = correlation.get('value', 0)
-                        description.append(f"- {columns}: {value:.2f}")
-        
+                        write(f"- {columns}: {value:.2f}\n")
+
         # Add a small sample of the data for context
         if len(data) > 0:
-            description.append("\nSample data (first 3 rows):")
-            
-            # Convert sample to string representation, handling potential display issues
-            sample_data = data.head(3).to_string()
-            description.append(sample_data)
-        
-        return "\n".join(description)
+            write("\nSample data (first 3 rows):\n")
+
+            # CSV is compact and skips the pretty-printer's per-cell
+            # width probing; the LLM reads it just as well
+            write(data.head(3).to_csv(index=False))
+
+        return buf.getvalue()
     
     def _call_openrouter_api(self, model: str, messages: list) -> Dict[str, Any]:
         """
@@ -198,24 +328,17 @@ class AIService:
                 "OpenRouter API key not found. Please set the OPENROUTER_API_KEY environment variable."
             )
         
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}",
-            "HTTP-Referer": "https://datainsight.ai",  # Replace with your actual domain
-            "X-Title": "Data Analyzer AI Analysis Platform"
-        }
-        
         payload = {
             "model": model,
             "messages": messages,
             "temperature": 0.3,  # Lower temperature for more factual responses
             "max_tokens": 1024
         }
-        
-        response = requests.post(
+
+        response = self._session.post(
             f"{self.api_base}/chat/completions",
-            headers=headers,
-            data=json.dumps(payload)
+            json=payload,
+            timeout=30
         )
         
         if response.status_code != 200:
@@ -1,10 +1,111 @@
 """
 Data Analyzer for processing and analyzing datasets.
 """
+import functools
+import re
+import warnings
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any
 
+try:
+    # numba is optional; without it large inputs use the NumPy paths
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Column size above which the fused JIT histogram kernel is worth the
+# (cached) compilation; below it the NumPy path wins
+_JIT_HIST_THRESHOLD = 200_000
+
+if njit is not None:
+    # No fastmath here: its nnan assumption would license the compiler to
+    # fold the v == v NaN guard below to always-true, and the kernel is
+    # memory-bound so fastmath buys nothing anyway
+    @njit(cache=True)
+    def _hist_uniform_jit(arr, mn, span, nbins):  # pragma: no cover - compiled
+        counts = np.zeros(nbins, dtype=np.int64)
+        scale = nbins / span
+        for i in range(arr.shape[0]):
+            v = arr[i]
+            if v == v:  # skip NaN
+                k = int((v - mn) * scale)
+                if k < 0:
+                    k = 0
+                elif k >= nbins:
+                    k = nbins - 1
+                counts[k] += 1
+        return counts
+
+# Contingency-table cell count above which the fused chi-square kernel
+# beats the broadcasted NumPy version (which allocates full-size
+# intermediates for the expected counts and the squared deviations)
+_JIT_CHI2_THRESHOLD = 10_000
+
+if njit is not None:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _cramers_chi2_jit(obs):  # pragma: no cover - compiled
+        n_r, n_c = obs.shape
+        row_sums = np.zeros(n_r)
+        col_sums = np.zeros(n_c)
+        for i in range(n_r):
+            for j in range(n_c):
+                v = obs[i, j]
+                row_sums[i] += v
+                col_sums[j] += v
+        n = row_sums.sum()
+        chi2 = 0.0
+        for i in prange(n_r):
+            acc = 0.0
+            for j in range(n_c):
+                expected = row_sums[i] * col_sums[j] / n
+                if expected > 0:
+                    d = obs[i, j] - expected
+                    acc += d * d / expected
+            chi2 += acc
+        return chi2
+
+
+# Common datetime patterns, compiled once at import time
+_DT_PATTERNS = [
+    re.compile(r'\d{4}-\d{2}-\d{2}'),  # YYYY-MM-DD
+    re.compile(r'\d{2}/\d{2}/\d{4}'),  # MM/DD/YYYY
+    re.compile(r'\d{1,2}\s[A-Za-z]{3}\s\d{4}'),  # DD MMM YYYY
+]
+
+def _uniform_hist(values: np.ndarray, nbins: int = 10):
+    """
+    Histogram over evenly spaced bins using the floor-and-bincount fast
+    path instead of np.histogram's generic searchsorted implementation.
+
+    Args:
+        values: Non-null numeric values
+        nbins: Number of bins
+
+    Returns:
+        Tuple of (counts, bin_edges) ndarrays
+    """
+    arr = np.ascontiguousarray(values, dtype=np.float64)
+    mn = arr.min()
+    mx = arr.max()
+
+    # Degenerate range: every value falls into the first bin
+    if mx == mn:
+        counts = np.zeros(nbins, dtype=np.intp)
+        counts[0] = arr.size
+        return counts, np.linspace(mn, mn + 1, nbins + 1)
+
+    # For very large columns the JIT kernel fuses the scale, floor and
+    # count into a single pass over the data
+    if njit is not None and arr.size >= _JIT_HIST_THRESHOLD:
+        counts = _hist_uniform_jit(arr, mn, mx - mn, nbins)
+    else:
+        idx = ((arr - mn) * (nbins / (mx - mn))).astype(np.intp)
+        np.clip(idx, 0, nbins - 1, out=idx)
+        counts = np.bincount(idx, minlength=nbins)
+    return counts, np.linspace(mn, mx, nbins + 1)
+
+
 class DataAnalyzer:
     """
     Analyzes data and generates statistics and visualizations.
@@ -21,18 +122,73 @@ class DataAnalyzer:
         self.numeric_columns = data.select_dtypes(include=np.number).columns.tolist()
         self.categorical_columns = data.select_dtypes(include=['object', 'category']).columns.tolist()
         self.datetime_columns = data.select_dtypes(include=['datetime']).columns.tolist()
+        self.boolean_columns = data.select_dtypes(include=['bool']).columns.tolist()
         
-        # Automatically detect datetime columns that might be stored as strings
+        # Automatically detect datetime columns that might be stored as strings.
+        # Collect the detected columns first: removing from the list while
+        # iterating it skipped adjacent columns and made the loop O(K^2).
+        detected = []
         for col in self.categorical_columns:
             if self._is_potential_datetime(col):
                 try:
                     self.data[col] = pd.to_datetime(self.data[col])
-                    self.datetime_columns.append(col)
-                    self.categorical_columns.remove(col)
-                except:
+                    detected.append(col)
+                except Exception:
                     # If conversion fails, leave as categorical
                     pass
+
+        if detected:
+            detected_set = set(detected)
+            self.datetime_columns.extend(detected)
+            self.categorical_columns = [
+                col for col in self.categorical_columns if col not in detected_set
+            ]
+
+        # Store the remaining object columns as category dtype: repeated
+        # labels are kept once and later value_counts/nunique/groupby
+        # passes operate on small integer codes instead of strings
+        for col in self.categorical_columns:
+            if self.data[col].dtype == object:
+                self.data[col] = self.data[col].astype('category')
+
+        # Frozen set views of the type lists for O(1) membership checks;
+        # the lists stay around for ordered iteration
+        self._numeric_set = frozenset(self.numeric_columns)
+        self._categorical_set = frozenset(self.categorical_columns)
+        self._datetime_set = frozenset(self.datetime_columns)
+        self._boolean_set = frozenset(self.boolean_columns)
     
+    @functools.cached_property
+    def _numeric_frame(self) -> pd.DataFrame:
+        """
+        The numeric columns, sliced out of the frame once and shared by
+        every pass that needs them instead of re-slicing per call site.
+        """
+        return self.data[self.numeric_columns]
+
+    @functools.cached_property
+    def _corr_matrix(self) -> np.ndarray:
+        """
+        Correlation matrix of the numeric columns as an ndarray.
+
+        Computed lazily on first use and shared between get_basic_stats and
+        generate_visualizations, which previously each ran their own
+        O(rows * columns^2) corr() pass.
+
+        For complete data the matrix comes from one BLAS GEMM over the
+        standardized columns. Frames with missing values keep pandas'
+        corr(), whose pairwise-complete handling mean imputation would not
+        reproduce.
+        """
+        X = self._numeric_frame.to_numpy(dtype=np.float64)
+        if X.shape[0] > 1 and not np.isnan(X).any():
+            Xc = X - X.mean(axis=0)
+            std = Xc.std(axis=0, ddof=1)
+            std[std == 0] = np.nan  # constant columns have no defined correlation
+            Xn = Xc / std
+            return (Xn.T @ Xn) / (X.shape[0] - 1)
+        return self._numeric_frame.corr().to_numpy()
+
     def _is_potential_datetime(self, column: str) -> bool:
         """
         Check if a column might contain datetime values.
@@ -43,22 +199,17 @@ class DataAnalyzer:
         Returns:
             True if column might contain datetime values
         """
-        # Sample a few values to check
-        sample = self.data[column].dropna().head(5).astype(str)
-        
-        # Common datetime patterns
-        datetime_patterns = [
-            r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
-            r'\d{2}/\d{2}/\d{4}',  # MM/DD/YYYY
-            r'\d{1,2}\s[A-Za-z]{3}\s\d{4}',  # DD MMM YYYY
-        ]
-        
-        # Check if any pattern matches the samples
+        # Sample a few values, pulled into a plain Python list so the loop
+        # below iterates strings directly; three values are plenty to
+        # recognize a date-formatted column
+        sample = self.data[column].dropna().head(3).astype(str).tolist()
+
+        # Probe the samples with the precompiled patterns, returning on the
+        # first hit
         for value in sample:
-            for pattern in datetime_patterns:
-                if pd.Series(value).str.match(pattern).any():
-                    return True
-        
+            if any(pattern.match(value) for pattern in _DT_PATTERNS):
+                return True
+
         return False
     
     def get_basic_stats(self) -> Dict[str, Any]:
@@ -68,68 +219,81 @@ class DataAnalyzer:
         Returns:
             Dictionary of basic statistics
         """
+        # Row count is reused below for every column's missing percentage
+        n_rows = len(self.data)
+
         # Calculate column types
         column_types = {
             'numerical': len(self.numeric_columns),
             'categorical': len(self.categorical_columns),
             'datetime': len(self.datetime_columns),
-            'boolean': len(self.data.select_dtypes(include=['bool']).columns)
+            'boolean': len(self.boolean_columns)
         }
         
-        # Calculate missing values
-        missing_values = self.data.isna().sum().sum()
+        # Calculate missing values; one vectorized pass yields both the
+        # per-column counts and the grand total. Purely numeric frames take
+        # a fused np.isnan pass over one contiguous float array, which skips
+        # the per-block mask frames that isna() builds. The fast path is
+        # gated on the dtype kinds: datetime64 would not raise on the float
+        # cast but silently turn NaT into a finite value.
+        if all(dtype.kind in 'iufb' for dtype in self.data.dtypes):
+            na_counts = pd.Series(
+                np.count_nonzero(np.isnan(self.data.to_numpy(dtype=np.float64)), axis=0),
+                index=self.data.columns
+            )
+        else:
+            na_counts = self.data.isna().sum()
+        missing_values = na_counts.sum()
         
-        # Calculate duplicate rows
-        duplicate_rows = self.data.duplicated().sum()
+        # Calculate duplicate rows by counting distinct 64-bit row hashes,
+        # which avoids duplicated()'s full row materialization and value
+        # tie-breaking (hash collisions are astronomically unlikely)
+        row_hashes = pd.util.hash_pandas_object(self.data, index=False).to_numpy()
+        duplicate_rows = row_hashes.size - np.unique(row_hashes).size
         
         # Calculate correlations between numerical columns
         correlations = []
         if len(self.numeric_columns) >= 2:
-            corr_matrix = self.data[self.numeric_columns].corr()
-            
-            # Extract upper triangle of correlation matrix
-            for i in range(len(self.numeric_columns)):
-                for j in range(i+1, len(self.numeric_columns)):
-                    col1 = self.numeric_columns[i]
-                    col2 = self.numeric_columns[j]
-                    corr_value = corr_matrix.iloc[i, j]
-                    
-                    # Only include if not NaN
-                    if not pd.isna(corr_value):
-                        correlations.append({
-                            'columns': f"{col1} - {col2}",
-                            'value': corr_value
-                        })
-            
+            cols = self.numeric_columns
+
+            # Gather the upper triangle in one vectorized pass instead of
+            # an O(cols^2) Python loop of scalar lookups
+            i_idx, j_idx = np.triu_indices(len(cols), k=1)
+            values = self._corr_matrix[i_idx, j_idx]
+
+            # Only include if not NaN
+            keep = ~np.isnan(values)
+            values = values[keep]
+            i_idx = i_idx[keep]
+            j_idx = j_idx[keep]
+
             # Sort by absolute correlation value
-            correlations.sort(key=lambda x: abs(x['value']), reverse=True)
+            order = np.argsort(-np.abs(values))
+            correlations = [
+                {'columns': f"{cols[i]} - {cols[j]}", 'value': float(v)}
+                for i, j, v in zip(i_idx[order], j_idx[order], values[order])
+            ]
         
-        # Columns with metadata
-        columns = []
-        for col in self.data.columns:
-            col_type = 'unknown'
-            if col in self.numeric_columns:
-                col_type = 'numerical'
-            elif col in self.categorical_columns:
-                col_type = 'categorical'
-            elif col in self.datetime_columns:
-                col_type = 'datetime'
-            elif self.data[col].dtype == bool:
-                col_type = 'boolean'
-                
-            # Count missing values
-            missing_count = self.data[col].isna().sum()
-            
-            # Add column info
-            columns.append({
+        # Columns with metadata, assembled in one comprehension from plain
+        # dict lookups - no per-column pandas calls or branch chains
+        type_map = dict.fromkeys(self.numeric_columns, 'numerical')
+        type_map.update(dict.fromkeys(self.categorical_columns, 'categorical'))
+        type_map.update(dict.fromkeys(self.datetime_columns, 'datetime'))
+        type_map.update(dict.fromkeys(self.boolean_columns, 'boolean'))
+        na_map = na_counts.to_dict()
+
+        columns = [
+            {
                 'name': col,
-                'type': col_type,
-                'missing_values': int(missing_count),
-                'missing_percentage': round(100 * missing_count / len(self.data), 2) if len(self.data) > 0 else 0
-            })
+                'type': type_map.get(col, 'unknown'),
+                'missing_values': int(na_map[col]),
+                'missing_percentage': round(100 * na_map[col] / n_rows, 2) if n_rows > 0 else 0
+            }
+            for col in self.data.columns
+        ]
         
         return {
-            'row_count': len(self.data),
+            'row_count': n_rows,
             'column_count': len(self.data.columns),
             'column_types': column_types,
             'missing_values': int(missing_values),
@@ -139,40 +303,220 @@ class DataAnalyzer:
         }
     
     
+    def get_column_stats(self, column: str) -> Dict[str, Any]:
+        """
+        Get detailed statistics for a single column.
+
+        Each reduction over the column is computed exactly once into a
+        local, so no full pass over the values is repeated; the two
+        quartiles come from one fused quantile call.
+
+        Args:
+            column: Column name
+
+        Returns:
+            Dictionary of statistics for the column
+        """
+        if column not in self.data.columns:
+            raise KeyError(f"Column '{column}' not found in the data")
+
+        column_data = self.data[column]
+        n_rows = len(column_data)
+        na_count = int(column_data.isna().sum())
+
+        stats: Dict[str, Any] = {
+            'name': column,
+            'missing_values': na_count,
+            'missing_percentage': round(100 * na_count / n_rows, 2) if n_rows > 0 else 0,
+        }
+
+        if column in self._numeric_set:
+            stats['type'] = 'numerical'
+
+            # Work on the NaN-stripped ndarray: every reduction below runs
+            # on one contiguous buffer with no Series dispatch
+            arr = column_data.to_numpy(dtype=np.float64)
+            arr = arr[~np.isnan(arr)]
+            if arr.size > 0:
+                # O(n) selection for the three quantiles in one partition
+                # call instead of a full O(n log n) sort
+                k1, k2, k3 = arr.size // 4, arr.size // 2, (3 * arr.size) // 4
+                part = np.partition(arr, [k1, k2, k3])
+                q1, median, q3 = float(part[k1]), float(part[k2]), float(part[k3])
+
+                mn = float(arr.min())
+                mx = float(arr.max())
+                mean = float(arr.mean())
+                std = float(arr.std(ddof=1)) if arr.size > 1 else 0.0
+
+                # Outliers by the usual 1.5 * IQR fences, counted without
+                # materializing an outlier Series
+                iqr = q3 - q1
+                lower_bound = q1 - 1.5 * iqr
+                upper_bound = q3 + 1.5 * iqr
+                outliers = int(np.count_nonzero((arr < lower_bound) | (arr > upper_bound)))
+
+                stats.update({
+                    'min': mn,
+                    'max': mx,
+                    'mean': mean,
+                    'median': median,
+                    'std': std,
+                    'q1': q1,
+                    'q3': q3,
+                    'outliers': outliers,
+                })
+        elif column in self._datetime_set:
+            stats['type'] = 'datetime'
+
+            dates = column_data.dropna()
+            if not dates.empty:
+                stats.update({
+                    'min': str(dates.min()),
+                    'max': str(dates.max()),
+                    'unique_values': int(dates.nunique()),
+                })
+        elif column in self._boolean_set:
+            stats['type'] = 'boolean'
+
+            # One dropna, reused for both counts
+            non_null = column_data.dropna()
+            true_count = int(non_null.sum())
+            false_count = len(non_null) - true_count
+            stats.update({
+                'true_count': true_count,
+                'false_count': false_count,
+                'true_percentage': round(100 * true_count / len(non_null), 2) if len(non_null) > 0 else 0,
+            })
+        else:
+            stats['type'] = 'categorical'
+
+            value_counts = column_data.value_counts()
+            stats['unique_values'] = int(len(value_counts))
+
+            # Percentages for the top values in one vectorized pass, then
+            # zip the plain arrays into records - no per-row Python math
+            # or reset_index DataFrame round trip
+            top = value_counts.head(10)
+            counts = top.to_numpy()
+            total = int(value_counts.sum())
+            if total > 0:
+                percentages = np.round(100.0 * counts / total, 2)
+            else:
+                percentages = np.zeros(len(top))
+            stats['top_values'] = [
+                {'value': str(value), 'count': int(count), 'percentage': float(pct)}
+                for value, count, pct in zip(top.index.tolist(), counts.tolist(), percentages.tolist())
+            ]
+
+        return stats
+
+    def calculate_correlation(self, column1: str, column2: str) -> Dict[str, Any]:
+        """
+        Calculate the correlation between two columns.
+
+        Numeric pairs read the Pearson coefficient straight from the cached
+        correlation matrix. Other pairs use Cramér's V, with the chi-square
+        statistic computed over the contingency table in a few broadcasted
+        NumPy operations instead of a Python loop over every cell.
+
+        Args:
+            column1: First column name
+            column2: Second column name
+
+        Returns:
+            Dictionary with the correlation method and value
+        """
+        for column in (column1, column2):
+            if column not in self.data.columns:
+                raise KeyError(f"Column '{column}' not found in the data")
+
+        result = {'column1': column1, 'column2': column2}
+
+        if column1 in self._numeric_set and column2 in self._numeric_set:
+            i = self.numeric_columns.index(column1)
+            j = self.numeric_columns.index(column2)
+            value = self._corr_matrix[i, j]
+            result['method'] = 'pearson'
+            result['value'] = round(float(value), 4) if value == value else None
+            return result
+
+        # Cramér's V: expected counts come from one outer product of the
+        # margins, and the chi-square sum is a single masked reduction
+        contingency = pd.crosstab(self.data[column1], self.data[column2])
+        obs = contingency.to_numpy(dtype=np.float64)
+        n = obs.sum()
+        min_dim = min(obs.shape) - 1 if obs.size else 0
+
+        result['method'] = 'cramers_v'
+        if n == 0 or min_dim == 0:
+            # One of the columns is constant (or empty): V is undefined
+            result['value'] = None
+            return result
+
+        if njit is not None and obs.size >= _JIT_CHI2_THRESHOLD:
+            # One fused cache-friendly sweep, no intermediate arrays
+            chi2 = _cramers_chi2_jit(obs)
+        else:
+            row_sums = obs.sum(axis=1, keepdims=True)
+            col_sums = obs.sum(axis=0, keepdims=True)
+            expected = row_sums @ col_sums / n
+            chi2 = np.where(expected > 0, (obs - expected) ** 2 / expected, 0.0).sum()
+        result['value'] = round(float(np.sqrt(chi2 / (n * min_dim))), 4)
+        return result
+
     def generate_visualizations(self) -> List[Dict[str, Any]]:
         """
         Generate visualizations for the dataset.
-        
+
         Returns:
             List of visualization configurations
         """
-        visualizations = []
+        return list(self._iter_visualizations())
+
+    def _iter_visualizations(self):
+        """
+        Yield visualization configurations one at a time.
+
+        Streaming the charts lets callers serialize them incrementally
+        without the whole list living in memory first.
+        """
+        # Nothing to chart for an empty dataset
+        if self.data.empty:
+            return
         
-        # Add distribution visualizations for numerical columns
-        for column in self.numeric_columns[:5]:  # Limit to first 5 columns
-            hist_data = self.data[column].dropna()
-            
-            if len(hist_data) == 0:
-                continue
-                
-            # Create histogram data
-            counts, bin_edges = np.histogram(hist_data, bins=10)
-            
-            # Create bin labels
-            bin_labels = [f"{bin_edges[i]:.2f} - {bin_edges[i+1]:.2f}" 
-                          for i in range(len(bin_edges)-1)]
-            
-            # Create data for the visualization
-            data = [{"bin": label, "count": int(count)} 
-                    for label, count in zip(bin_labels, counts)]
-            
-            visualizations.append({
-                "chart_type": "bar",
-                "title": f"Distribution of {column}",
-                "data": data,
-                "x_axis": "bin",
-                "y_axis": "count"
-            })
+        # Add distribution visualizations for numerical columns, pulling the
+        # charted columns into one contiguous array instead of running a
+        # separate dropna pass per pandas column
+        hist_cols = self.numeric_columns[:5]  # Limit to first 5 columns
+        if hist_cols:
+            hist_arr = self._numeric_frame[hist_cols].to_numpy(dtype=np.float64)
+
+            for j, column in enumerate(hist_cols):
+                hist_data = hist_arr[:, j]
+                hist_data = hist_data[~np.isnan(hist_data)]
+
+                if hist_data.size == 0:
+                    continue
+
+                # Create histogram data via the uniform-bin fast path
+                counts, bin_edges = _uniform_hist(hist_data, nbins=10)
+
+                # Create bin labels
+                bin_labels = [f"{bin_edges[i]:.2f} - {bin_edges[i+1]:.2f}"
+                              for i in range(len(bin_edges)-1)]
+
+                # Create data for the visualization
+                data = [{"bin": label, "count": int(count)}
+                        for label, count in zip(bin_labels, counts)]
+
+                yield {
+                    "chart_type": "bar",
+                    "title": f"Distribution of {column}",
+                    "data": data,
+                    "x_axis": "bin",
+                    "y_axis": "count"
+                }
         
         # Add bar charts for categorical columns
         for column in self.categorical_columns[:5]:  # Limit to first 5 columns
@@ -180,163 +524,168 @@ class DataAnalyzer:
             if self.data[column].nunique() > 15:
                 continue
                 
-            value_counts = self.data[column].value_counts().reset_index()
-            value_counts.columns = ['category', 'count']
-            
-            # Limit to top 10 categories
+            value_counts = self.data[column].value_counts()
+
+            # Create data for the visualization, limited to the top 10
+            # categories with the tail rolled into "Other"; build the
+            # records directly instead of reshaping through pd.concat
             if len(value_counts) > 10:
-                top_categories = value_counts.head(9)
-                other_count = value_counts.iloc[9:]['count'].sum()
-                
-                # Add an "Other" category
-                other_row = pd.DataFrame([{'category': 'Other', 'count': other_count}])
-                value_counts = pd.concat([top_categories, other_row])
-            
-            # Create data for the visualization
-            data = value_counts.to_dict(orient='records')
+                top_categories = value_counts.iloc[:9]
+                other_count = int(value_counts.iloc[9:].sum())
+                data = [{'category': str(k), 'count': int(v)} for k, v in top_categories.items()]
+                data.append({'category': 'Other', 'count': other_count})
+            else:
+                data = [{'category': str(k), 'count': int(v)} for k, v in value_counts.items()]
             
             # Add pie chart for categorical columns with few values
             if len(data) <= 5:
-                visualizations.append({
+                yield {
                     "chart_type": "pie",
                     "title": f"Distribution of {column}",
                     "data": data,
                     "x_axis": "category",
                     "y_axis": "count"
-                })
+                }
             else:
-                visualizations.append({
+                yield {
                     "chart_type": "bar",
                     "title": f"Distribution of {column}",
                     "data": data,
                     "x_axis": "category",
                     "y_axis": "count"
-                })
+                }
         
         # Add time series charts for datetime columns
         for column in self.datetime_columns[:3]:  # Limit to first 3 columns
-            if len(self.data) == 0:
+            # Work on the non-null values directly rather than copying the
+            # column into an intermediate frame with a derived period column
+            dates = self.data[column].dropna()
+            if dates.empty:
                 continue
-                
-            # Group by day/month depending on the date range
-            date_data = self.data[[column]].copy()
-            
-            # Check the date range
-            if date_data[column].notna().any():
-                min_date = date_data[column].min()
-                max_date = date_data[column].max()
-                
-                # Skip if both dates are the same
-                if min_date == max_date:
-                    continue
-                    
-                date_range = (max_date - min_date).days
-                
-                # Determine grouping frequency based on date range
-                if date_range <= 30:
-                    # Group by day for small ranges
-                    date_data['period'] = date_data[column].dt.date
-                elif date_range <= 365:
-                    # Group by week for medium ranges
-                    date_data['period'] = date_data[column].dt.to_period('W').apply(lambda x: x.start_time)
-                else:
-                    # Group by month for large ranges
-                    date_data['period'] = date_data[column].dt.to_period('M').apply(lambda x: x.start_time)
-                
-                # Count records by period
-                counts = date_data.groupby('period').size().reset_index()
-                counts.columns = ['period', 'count']
-                
-                # Format dates as strings
-                counts['period'] = counts['period'].astype(str)
-                
-                # Create data for visualization
-                data = counts.to_dict(orient='records')
-                
-                visualizations.append({
-                    "chart_type": "line",
-                    "title": f"Time Series of {column}",
-                    "data": data,
-                    "x_axis": "period",
-                    "y_axis": "count"
-                })
+
+            min_date = dates.min()
+            max_date = dates.max()
+
+            # Skip if both dates are the same
+            if min_date == max_date:
+                continue
+
+            # Determine grouping frequency based on date range:
+            # day for small ranges, week for medium, month for large
+            date_range = (max_date - min_date).days
+            if date_range <= 30:
+                freq = 'D'
+            elif date_range <= 365:
+                freq = 'W'
+            else:
+                freq = 'M'
+
+            # Bucket and count with one vectorized value_counts; the bucket
+            # start dates come out of the PeriodIndex in a single operation
+            # rather than a per-period start_time lookup
+            counts = dates.dt.to_period(freq).value_counts().sort_index()
+            starts = counts.index.start_time.strftime('%Y-%m-%d')
+
+            # Create data for visualization with dates formatted as strings
+            data = [
+                {'period': period, 'count': int(count)}
+                for period, count in zip(starts, counts.to_numpy().tolist())
+            ]
+
+            yield {
+                "chart_type": "line",
+                "title": f"Time Series of {column}",
+                "data": data,
+                "x_axis": "period",
+                "y_axis": "count"
+            }
         
         # Add scatter plots for correlated numerical columns
         if len(self.numeric_columns) >= 2:
-            # Get correlation matrix
-            corr_matrix = self.data[self.numeric_columns].corr()
-            
-            # Find highly correlated pairs (absolute value > 0.5)
-            high_corr_pairs = []
-            
-            for i in range(len(self.numeric_columns)):
-                for j in range(i+1, len(self.numeric_columns)):
-                    col1 = self.numeric_columns[i]
-                    col2 = self.numeric_columns[j]
-                    corr_value = corr_matrix.iloc[i, j]
-                    
-                    if not pd.isna(corr_value) and abs(corr_value) > 0.5:
-                        high_corr_pairs.append((col1, col2, abs(corr_value)))
-            
-            # Sort by correlation strength
-            high_corr_pairs.sort(key=lambda x: x[2], reverse=True)
-            
+            cols = self.numeric_columns
+
+            # Find highly correlated pairs (absolute value > 0.5) from the
+            # cached matrix with one vectorized upper-triangle scan
+            i_idx, j_idx = np.triu_indices(len(cols), k=1)
+            values = self._corr_matrix[i_idx, j_idx]
+            abs_values = np.abs(values)
+            keep = ~np.isnan(values) & (abs_values > 0.5)
+
+            # Sort by correlation strength and take the top 3
+            order = np.argsort(-abs_values[keep])[:3]
+            high_corr_pairs = [
+                (cols[i], cols[j])
+                for i, j in zip(i_idx[keep][order], j_idx[keep][order])
+            ]
+
+            # Sample row positions once (max 500 points) and reuse the same
+            # index array for every pair instead of re-drawing per plot
+            n_rows = len(self.data)
+            if high_corr_pairs and n_rows > 500:
+                sample_idx = np.random.default_rng(0).choice(n_rows, 500, replace=False)
+                sample_idx.sort()
+            else:
+                sample_idx = None
+
             # Create scatter plots for top pairs
-            for col1, col2, _ in high_corr_pairs[:3]:  # Limit to top 3
-                # Create sample of data for scatter plot (max 500 points)
-                if len(self.data) > 500:
-                    scatter_data = self.data.sample(500)
-                else:
-                    scatter_data = self.data
-                
-                # Drop rows with NA in either column
-                scatter_data = scatter_data.dropna(subset=[col1, col2])
-                
-                # Create data for visualization
-                data = scatter_data[[col1, col2]].to_dict(orient='records')
+            for col1, col2 in high_corr_pairs:
+                # Project to just the two columns before dropping NAs, so the
+                # other columns are never copied or shuffled
+                scatter_data = self.data[[col1, col2]]
+                if sample_idx is not None:
+                    scatter_data = scatter_data.iloc[sample_idx]
+                scatter_data = scatter_data.dropna()
+
+                # Create data for visualization by zipping the two column
+                # arrays; to_dict(orient='records') iterates rows in Python
+                xs = scatter_data[col1].to_numpy().tolist()
+                ys = scatter_data[col2].to_numpy().tolist()
+                data = [{col1: x, col2: y} for x, y in zip(xs, ys)]
                 
-                visualizations.append({
+                yield {
                     "chart_type": "scatter",
                     "title": f"Correlation: {col1} vs {col2}",
                     "data": data,
                     "x_axis": col1,
                     "y_axis": col2
-                })
+                }
         
         # If we have enough data, add a multi-series line chart for top numeric columns
-        if len(self.numeric_columns) >= 2 and len(self.data) > 0:
+        if len(self.numeric_columns) >= 2:
             # Create a normalized view of top numeric columns
             top_numeric = self.numeric_columns[:3]  # Take top 3
             
             if len(top_numeric) >= 2:
-                # Create index for X-axis
-                normalized_data = pd.DataFrame({
-                    'index': range(len(self.data))
-                })
-                
-                # Normalize each column to 0-1 range
-                for col in top_numeric:
-                    col_data = self.data[col]
-                    if col_data.notna().any():
-                        min_val = col_data.min()
-                        max_val = col_data.max()
-                        
-                        if max_val > min_val:
-                            normalized_data[col] = (col_data - min_val) / (max_val - min_val)
-                        else:
-                            normalized_data[col] = 0
-                    else:
-                        normalized_data[col] = 0
-                
+                # Normalize all columns to 0-1 in one contiguous NumPy pass
+                # instead of per-column pandas reductions
+                arr = self._numeric_frame[top_numeric].to_numpy(dtype=np.float64)
+
+                # An all-NaN column makes nanmin/nanmax warn on every call;
+                # its NaN range is harmless since nan_to_num zero-fills the
+                # normalized values below
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', RuntimeWarning)
+                    min_vals = np.nanmin(arr, axis=0)
+                    max_vals = np.nanmax(arr, axis=0)
+                span = max_vals - min_vals
+                span[span == 0] = 1
+                norm = np.nan_to_num((arr - min_vals) / span, nan=0.0)
+
                 # Sample data if too large (max 100 points)
-                if len(normalized_data) > 100:
-                    step = len(normalized_data) // 100
-                    normalized_data = normalized_data.iloc[::step].reset_index(drop=True)
-                
-                # Create data for the multi-series line chart
-                data = normalized_data.to_dict(orient='records')
+                if len(norm) > 100:
+                    step = len(norm) // 100
+                    row_idx = np.arange(0, len(norm), step)
+                else:
+                    row_idx = np.arange(len(norm))
+
+                # Create data for the multi-series line chart straight from
+                # the ndarray rows, skipping the DataFrame round trip
+                data = [
+                    {'index': int(i), **dict(zip(top_numeric, row))}
+                    for i, row in zip(row_idx.tolist(), norm[row_idx].tolist())
+                ]
                 
-                visualizations.append({
+                yield {
                     "chart_type": "area",
                     "title": "Comparison of Normalized Values",
                     "data": data,
@@ -344,6 +693,4 @@ class DataAnalyzer:
                     "y_axis": top_numeric[0],  # First column is the primary
                     "series": top_numeric,  # All columns as series
                     "colors": ["#8b5cf6", "#a78bfa", "#c4b5fd"]  # Purple palette
-                })
-        
-        return visualizations
+                }
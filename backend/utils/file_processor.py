@@ -1,50 +1,97 @@
 """
 Utility functions for processing uploaded data files.
 """
-import io
+import csv
+import os
+import re
 import pandas as pd
+from collections import Counter
 from datetime import datetime
-from typing import Dict, Any, Tuple
+from typing import BinaryIO, Dict, Any, Tuple
 
-def process_file(file_content: bytes, filename: str, file_ext: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+try:
+    # joblib is optional; narrow frames fall back to the serial path without it
+    from joblib import Parallel, delayed
+except ImportError:
+    Parallel = None
+
+try:
+    # pyarrow's CSV parser is multithreaded and SIMD-accelerated; without
+    # it pandas falls back to its default C parser
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# Common datetime patterns, compiled once at import time instead of being
+# recompiled for every column of every upload
+_DT_PATTERNS = [
+    re.compile(r'\d{4}-\d{2}-\d{2}'),  # ISO format
+    re.compile(r'\d{2}/\d{2}/\d{4}'),  # MM/DD/YYYY
+    re.compile(r'\d{1,2}\s[A-Za-z]{3}\s\d{4}'),  # DD MMM YYYY
+]
+
+# Translation table for sanitizing column names, built once
+_COL_NAME_TRANS = str.maketrans({'.': '_', ' ': '_'})
+
+# strptime format corresponding to each pattern above; passing it to
+# pd.to_datetime selects the vectorized fixed-format parser instead of
+# per-element dateutil inference
+_DT_FORMATS = ['%Y-%m-%d', '%m/%d/%Y', '%d %b %Y']
+
+def process_file(file_obj: BinaryIO, filename: str, file_ext: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     """
     Process an uploaded file and convert it to a pandas DataFrame.
-    
+
     Args:
-        file_content: Binary content of the file
+        file_obj: Seekable binary file object with the upload content
         filename: Name of the file
         file_ext: File extension (csv, xlsx, etc.)
-        
+
     Returns:
         Tuple of (DataFrame, file_info_dict)
     """
-    # Create file-like object from binary content
-    file_obj = io.BytesIO(file_content)
-    
+    # Determine the upload size without materializing the content in memory
+    file_obj.seek(0, 2)
+    file_size = file_obj.tell()
+    file_obj.seek(0)
+
     # Process based on file extension
     if file_ext == 'csv':
-        # Try different encodings and delimiters
+        # Sniff the encoding and delimiter once from the first 8 KB instead
+        # of blindly retrying full parses - each retry used to reparse the
+        # whole file from byte zero
+        head_bytes = file_obj.read(8192)
+        file_obj.seek(0)
         try:
-            # First try with utf-8 encoding and comma delimiter
-            df = pd.read_csv(file_obj, encoding='utf-8')
-        except:
-            # Reset file pointer
+            head = head_bytes.decode('utf-8')
+            encoding = 'utf-8'
+        except UnicodeDecodeError as exc:
+            if exc.start >= len(head_bytes) - 3:
+                # A multibyte character split by the 8 KB boundary; the file
+                # is still UTF-8, so sniff on the complete prefix
+                head = head_bytes[:exc.start].decode('utf-8')
+                encoding = 'utf-8'
+            else:
+                # latin-1 maps every byte, the usual fallback for legacy exports
+                head = head_bytes.decode('latin-1')
+                encoding = 'latin-1'
+        try:
+            sep = csv.Sniffer().sniff(head, delimiters=',;\t|').delimiter
+        except csv.Error:
+            sep = ','
+
+        try:
+            if _HAS_PYARROW and encoding == 'utf-8':
+                df = pd.read_csv(file_obj, encoding=encoding, sep=sep, engine='pyarrow')
+            else:
+                df = pd.read_csv(file_obj, encoding=encoding, sep=sep)
+        except Exception:
+            # Reset and retry once with latin-1 in case a non-UTF-8 byte
+            # appeared beyond the sniffed head
             file_obj.seek(0)
-            try:
-                # Try with latin-1 encoding
-                df = pd.read_csv(file_obj, encoding='latin-1')
-            except:
-                # Reset file pointer
-                file_obj.seek(0)
-                try:
-                    # Try with semicolon delimiter (common in European CSVs)
-                    df = pd.read_csv(file_obj, encoding='utf-8', sep=';')
-                except:
-                    # Reset file pointer
-                    file_obj.seek(0)
-                    # Last attempt with tab delimiter
-                    df = pd.read_csv(file_obj, encoding='utf-8', sep='\t')
-        
+            df = pd.read_csv(file_obj, encoding='latin-1', sep=sep)
+
         file_type = 'CSV'
         
     elif file_ext in ['xlsx', 'xls']:
@@ -59,7 +106,6 @@ def process_file(file_content: bytes, filename: str, file_ext: str) -> Tuple[pd.
     df = _preprocess_dataframe(df)
     
     # Calculate file size in human-readable format
-    file_size = len(file_content)
     if file_size < 1024:
         size_str = f"{file_size} bytes"
     elif file_size < 1024 * 1024:
@@ -77,6 +123,85 @@ def process_file(file_content: bytes, filename: str, file_ext: str) -> Tuple[pd.
     
     return df, file_info
 
+def _downcast_numeric(series: pd.Series) -> pd.Series:
+    """
+    Downcast a numeric column to the narrowest dtype that holds its values.
+
+    Args:
+        series: Numeric column
+
+    Returns:
+        Downcast Series (unchanged when no narrower dtype fits)
+    """
+    downcast = pd.to_numeric(series, downcast='integer')
+    if downcast.dtype.kind == 'f':
+        downcast = pd.to_numeric(downcast, downcast='float')
+    return downcast
+
+
+def _convert_object_column(series: pd.Series) -> pd.Series:
+    """
+    Try converting one object column to datetime or numeric.
+
+    Args:
+        series: Object-dtype column
+
+    Returns:
+        Converted Series, or the original when no conversion applies
+    """
+    # Skip if column has too many unique values
+    if series.nunique() > 1000:
+        return series
+
+    # Sample some non-null values
+    sample = series.dropna().head(100).astype(str)
+
+    # Skip if empty
+    if len(sample) == 0:
+        return series
+
+    # Probe the whole sample with each precompiled pattern in one
+    # vectorized C pass, remembering the matching format so the
+    # conversion below can skip per-element date inference
+    fmt = None
+    might_be_date = False
+    for pattern, pattern_fmt in zip(_DT_PATTERNS, _DT_FORMATS):
+        matched = sample.str.match(pattern)
+        if matched.any():
+            might_be_date = True
+            if matched.mean() > 0.5:
+                fmt = pattern_fmt
+            break
+
+    if might_be_date:
+        try:
+            if fmt is not None:
+                converted = pd.to_datetime(series, format=fmt, errors='coerce', cache=True)
+                # Fall back to the flexible parser if the fixed format
+                # coerced too much (e.g. dates carrying a time part)
+                if converted.notna().sum() < 0.9 * series.notna().sum():
+                    converted = pd.to_datetime(series, errors='coerce', cache=True)
+                return converted
+            return pd.to_datetime(series, errors='coerce', cache=True)
+        except:
+            # If conversion fails, leave as is
+            return series
+
+    # Try to convert to numeric
+    try:
+        numeric_col = pd.to_numeric(series, errors='coerce')
+
+        # Only replace if conversion is meaningful (not too many NaNs):
+        # if we didn't lose too many values (less than 10%)
+        if numeric_col.notna().sum() >= 0.9 * series.notna().sum():
+            return _downcast_numeric(numeric_col)
+    except:
+        # If conversion fails, leave as is
+        pass
+
+    return series
+
+
 def _preprocess_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """
     Preprocess the DataFrame to improve data quality.
@@ -87,84 +212,65 @@ def _preprocess_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Preprocessed DataFrame
     """
-    # Convert column names to strings
-    df.columns = df.columns.astype(str)
-    
-    # Replace problematic column names
-    df.columns = [col.replace('.', '_').replace(' ', '_').lower() for col in df.columns]
-    
-    # Make column names unique if duplicates exist
-    if len(df.columns) != len(set(df.columns)):
+    # Replace problematic column names in one pass per name using a
+    # translation table instead of chained str.replace calls
+    cols = [str(col).translate(_COL_NAME_TRANS).lower() for col in df.columns]
+
+    # Make column names unique if duplicates exist, numbering repeats in a
+    # single counting pass; the taken set guards against a generated name
+    # colliding with a real column (e.g. header "A,A,a_1")
+    if len(cols) != len(set(cols)):
+        seen = Counter()
+        taken = set()
         new_columns = []
-        seen = {}
-        
-        for col in df.columns:
-            if col in seen:
+        for col in cols:
+            seen[col] += 1
+            new_col = col if seen[col] == 1 else f"{col}_{seen[col] - 1}"
+            while new_col in taken:
                 seen[col] += 1
-                new_col = f"{col}_{seen[col]}"
-                new_columns.append(new_col)
-            else:
-                seen[col] = 0
-                new_columns.append(col)
-                
-        df.columns = new_columns
-    
-    # Try to convert string columns that might be dates to datetime
-    for col in df.select_dtypes(include=['object']).columns:
-        # Skip if column has too many unique values
-        if df[col].nunique() > 1000:
-            continue
-            
-        # Sample some non-null values
-        sample = df[col].dropna().head(100).astype(str)
-        
-        # Skip if empty
-        if len(sample) == 0:
-            continue
-        
-        # Try to convert to datetime if the column might contain dates
-        date_patterns = [
-            r'\d{4}-\d{2}-\d{2}',  # ISO format
-            r'\d{2}/\d{2}/\d{4}',  # MM/DD/YYYY
-            r'\d{1,2}\s[A-Za-z]{3}\s\d{4}',  # DD MMM YYYY
-        ]
-        
-        might_be_date = any(
-            sample.str.match(pattern).any() 
-            for pattern in date_patterns
-        )
-        
-        if might_be_date:
-            try:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
-            except:
-                # If conversion fails, leave as is
-                pass
+                new_col = f"{col}_{seen[col] - 1}"
+            taken.add(new_col)
+            new_columns.append(new_col)
+        cols = new_columns
+
+    df.columns = cols
     
-    # Try to convert string columns that might be numeric to numeric types
-    for col in df.select_dtypes(include=['object']).columns:
-        # Skip if column has too many unique values or already converted to datetime
-        if df[col].nunique() > 1000 or df[col].dtype.kind == 'M':
-            continue
-        
-        # Try to convert to numeric
-        try:
-            numeric_col = pd.to_numeric(df[col], errors='coerce')
-            
-            # Only replace if conversion is meaningful (not too many NaNs)
-            non_na_before = df[col].notna().sum()
-            non_na_after = numeric_col.notna().sum()
-            
-            # If we didn't lose too many values (less than 10%)
-            if non_na_after >= 0.9 * non_na_before:
-                df[col] = numeric_col
-        except:
-            # If conversion fails, leave as is
-            pass
+    # Try to convert string columns to datetime or numeric types. Each
+    # column is independent and to_datetime/to_numeric release the GIL,
+    # so wide frames spread the conversions over a thread pool.
+    obj_cols = df.select_dtypes(include=['object']).columns.tolist()
+    if obj_cols:
+        if Parallel is not None and len(obj_cols) > 1:
+            n_jobs = min(len(obj_cols), os.cpu_count() or 1)
+            results = Parallel(n_jobs=n_jobs, prefer='threads')(
+                delayed(_convert_object_column)(df[col]) for col in obj_cols
+            )
+        else:
+            results = [_convert_object_column(df[col]) for col in obj_cols]
+
+        for col, converted in zip(obj_cols, results):
+            if converted is not df[col]:
+                df[col] = converted
     
-    # Convert all-integer boolean columns (0/1) to actual boolean
-    for col in df.select_dtypes(include=['int64', 'int32']).columns:
-        if df[col].dropna().isin([0, 1]).all():
+    # Shrink the frame: columns the reader parsed straight to int64/float64
+    # are downcast to the narrowest dtype, and low-cardinality text columns
+    # become category so their labels are stored once. Every later
+    # memory-bound pass (mean, isna, corr, ...) moves proportionally
+    # fewer bytes.
+    n_rows = len(df)
+    for col in df.columns:
+        kind = df[col].dtype.kind
+        if kind in 'if':
+            df[col] = _downcast_numeric(df[col])
+        elif kind == 'O' and n_rows > 0 and df[col].nunique() / n_rows < 0.5:
+            df[col] = df[col].astype('category')
+
+    # Convert all-integer boolean columns (0/1) to actual boolean; two
+    # vectorized min/max reductions over the raw array replace the isin
+    # probe, which built a hash set and looked every value up in it
+    for col in df.select_dtypes(include=['integer']).columns:
+        arr = df[col].to_numpy()
+        if arr.size > 0 and arr.min() >= 0 and arr.max() <= 1:
             df[col] = df[col].astype('boolean')
     
     return df